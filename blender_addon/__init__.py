@@ -1,13 +1,32 @@
+import collections
+import contextlib
+import hashlib
 import json
 import math
+import os
 import os.path as osp
 import random
+import re
+import secrets
+import select
+import shutil
+import socket
+import subprocess
 import sys
 import tempfile
+import time
+import uuid
+
+# Optional modules
+try:
+    import orjson
+except ImportError:
+    orjson = None
 
 # Blender modules
 import bpy
 import mathutils
+import numpy as np
 
 
 # -----------------------------------------------------------------------------
@@ -16,6 +35,39 @@ import mathutils
 PI = math.pi
 EPS = sys.float_info.epsilon
 PREFIX = 'BNGP'
+DROPDOWN_ICONS = ('TRIA_RIGHT', 'TRIA_DOWN')  # Indexed by on/off
+
+# Script run by background render workers
+WORKER_SCRIPT = osp.join(osp.dirname(osp.abspath(__file__)),
+                         'render_worker.py')
+
+# Seconds after which an unused worker pool is stopped (checked periodically)
+POOL_IDLE_TIMEOUT = 300.0
+POOL_IDLE_CHECK_INTERVAL = 30.0
+# Jobs sent ahead to each worker (next one is queued while rendering)
+POOL_JOBS_PER_WORKER = 2
+# Seconds between polls of a rendering pool
+POOL_POLL_INTERVAL = 0.1
+
+# PNG compression for rendered images (percent, 15 is zlib level 1)
+PNG_COMPRESSION = 15
+
+# Render cache (rendered images keyed by camera & scene hash)
+CACHE_DIRNAME = osp.join(osp.expanduser('~'), '.cache', 'bngp')
+CACHE_MAX_BYTES = 8 * 1024 ** 3
+
+# Compute device type -> (device type enumerated by the driver,
+#                         environment variable to limit visible GPUs)
+GPU_VISIBLE_ENVS = {
+    'CUDA': ('CUDA', 'CUDA_VISIBLE_DEVICES'),
+    'OPTIX': ('CUDA', 'CUDA_VISIBLE_DEVICES'),
+    'HIP': ('HIP', 'HIP_VISIBLE_DEVICES'),
+}
+# PCI location at the end of Cycles device ids
+# (e.g. 'CUDA_NVIDIA GeForce RTX 3090_0000:01:00'
+#       'CUDA_NVIDIA GeForce RTX 3090_0000:01:00_OptiX')
+GPU_PCI_ID_PATTERN = re.compile(
+    r'([0-9a-fA-F]{4}:[0-9a-fA-F]{2}:[0-9a-fA-F]{2})(?:_OptiX)?$')
 
 
 # -----------------------------------------------------------------------------
@@ -47,7 +99,9 @@ def fetch_selected_objects(context):
 
 
 def set_selected_objects(objs):
-    bpy.ops.objects.select_all(action='DESELECT')
+    # Deselect current selection only (no operator, no full scene walk)
+    for obj in bpy.context.selected_objects:
+        obj.select_set(False)
     for obj in objs:
         obj.select_set(True)
 
@@ -64,6 +118,65 @@ def fetch_default_coll(context):
     return context.scene.collection
 
 
+# Names of data-blocks created by this addon (kind -> set of names)
+_BNGP_NAMES = dict()
+_BNGP_KINDS = ('cameras', 'objects', 'collections')
+
+
+def fetch_bngp_names(kind):
+    if not _BNGP_NAMES:
+        # Scan once (e.g. after the file was loaded or an undo step)
+        for k in _BNGP_KINDS:
+            _BNGP_NAMES[k] = {data.name for data in getattr(bpy.data, k)
+                              if data.name.startswith(PREFIX)}
+    return _BNGP_NAMES[kind]
+
+
+@bpy.app.handlers.persistent
+def reset_bngp_names(*args):
+    _BNGP_NAMES.clear()
+
+
+def fetch_gpu_pci_id(device):
+    match = GPU_PCI_ID_PATTERN.search(device.id)
+    return match.group(1).lower() if match else None
+
+
+def fetch_gpu_indices(context):
+    # Fetch compute device type and driver ordinals of GPUs enabled for Cycles
+    scene = context.scene
+    if scene.render.engine != 'CYCLES' or scene.cycles.device != 'GPU':
+        return None, []
+    addon = context.preferences.addons.get('cycles')
+    if addon is None:
+        return None, []
+    cprefs = addon.preferences
+    dev_type = cprefs.compute_device_type
+    if dev_type not in GPU_VISIBLE_ENVS:
+        return None, []  # Can not partition this device type
+
+    # Driver ordinals in PCI bus order (`CUDA_DEVICE_ORDER=PCI_BUS_ID`),
+    # which also covers OptiX listing only a subset of the CUDA devices
+    driver_type = GPU_VISIBLE_ENVS[dev_type][0]
+    pci_ids = [fetch_gpu_pci_id(device)
+               for device in cprefs.get_devices_for_type(driver_type)
+               if device.type != 'CPU']
+    if None in pci_ids:
+        return None, []  # Unknown device id format
+    ordinals = {pci_id: i for i, pci_id in enumerate(sorted(set(pci_ids)))}
+
+    # Ordinals of enabled devices
+    gpu_idxs = list()
+    for device in cprefs.get_devices_for_type(dev_type):
+        if device.type == 'CPU' or not device.use:
+            continue
+        pci_id = fetch_gpu_pci_id(device)
+        if pci_id not in ordinals:
+            return None, []
+        gpu_idxs.append(ordinals[pci_id])
+    return dev_type, sorted(set(gpu_idxs))
+
+
 def create_collection(context, name, parent_coll=None):
     if parent_coll is None:
         parent_coll = fetch_default_coll(context)
@@ -71,44 +184,99 @@ def create_collection(context, name, parent_coll=None):
     # Create new collection
     coll = bpy.data.collections.new(name)
     parent_coll.children.link(coll)  # Link
+    fetch_bngp_names('collections').add(coll.name)
     return coll
 
 
-def create_cam_obj(context, name, parent_coll=None):
+def create_cam_data(name, fov):
+    # Create new camera data (radian)
+    cam_data = bpy.data.cameras.new(name)
+    cam_data.lens_unit = 'FOV'
+    cam_data.angle = fov
+    fetch_bngp_names('cameras').add(cam_data.name)
+    return cam_data
+
+
+def create_cam_obj(context, name, parent_coll=None, cam_data=None):
     if parent_coll is None:
         parent_coll = fetch_default_coll(context)
+    if cam_data is None:
+        cam_data = bpy.data.cameras.new(name)
+        fetch_bngp_names('cameras').add(cam_data.name)
 
-    # Create new collection
-    cam = bpy.data.cameras.new(name)
-    cam_obj = bpy.data.objects.new(name, cam)
+    # Create new camera object
+    cam_obj = bpy.data.objects.new(name, cam_data)
     parent_coll.objects.link(cam_obj)  # Link
+    fetch_bngp_names('objects').add(cam_obj.name)
     return cam_obj
 
 
-def collect_by_name_prefix(data_coll, prefix):
-    # Collect name-matched objects
+def collect_by_name_prefix(data_coll, prefix, kind):
+    # Collect name-matched objects by hashed look-up
     collected_objs = list()
-    for obj in data_coll:
-        if obj.name.startswith(prefix):
+    for name in sorted(fetch_bngp_names(kind)):
+        if not name.startswith(prefix):
+            continue
+        obj = data_coll.get(name)
+        if obj is not None:
             collected_objs.append(obj)
     return collected_objs
 
 
-def remove_by_name_prefix(data_coll, prefix):
+def remove_by_name_prefix(data_coll, prefix, kind):
     # Collect
-    objs = collect_by_name_prefix(data_coll, prefix)
+    objs = collect_by_name_prefix(data_coll, prefix, kind)
     # Remove
     for obj in objs:
         try:
             data_coll.remove(obj, do_unlink=True)
         except Exception:
             data_coll.remove(obj)
+    # Forget removed (or already stale) names
+    names = fetch_bngp_names(kind)
+    names.difference_update([n for n in names if n.startswith(prefix)])
+
+
+def set_matrix_worlds(obj_coll, objs, mats):
+    # Transfer matrices (N, 4, 4) of all objects at once (`obj_coll` order)
+    try:
+        # RNA matrices are flattened in column-major order
+        flat_mats = mats.transpose(0, 2, 1).astype(np.float32).ravel()
+        obj_coll.foreach_set('matrix_world', flat_mats)
+    except (AttributeError, TypeError, RuntimeError):
+        # Fall back to per-object assignment
+        for obj, mat in zip(objs, mats):
+            obj.matrix_world = mathutils.Matrix(mat.tolist())
+
+
+@contextlib.contextmanager
+def temp_attrs(obj, **values):
+    # Override attributes temporarily (missing ones are skipped)
+    old_values = {name: getattr(obj, name) for name in values
+                  if hasattr(obj, name)}
+    try:
+        for name in old_values:
+            setattr(obj, name, values[name])
+        yield
+    finally:
+        for name, value in old_values.items():
+            setattr(obj, name, value)
+
+
+def save_json(filename, data):
+    if orjson is not None:
+        # Fast C encoder (handles NumPy arrays natively)
+        with open(filename, 'wb') as f:
+            f.write(orjson.dumps(data, option=orjson.OPT_SERIALIZE_NUMPY))
+    else:
+        with open(filename, 'w') as f:
+            json.dump(data, f, ensure_ascii=True, default=np.ndarray.tolist)
 
 
 def add_dropdown_ui(layout, props, prop_name, text):
     # Decide on/off icon
     is_active = getattr(props, prop_name)
-    icon = 'TRIA_DOWN' if is_active else 'TRIA_RIGHT'
+    icon = DROPDOWN_ICONS[is_active]
 
     # Create drop-down title
     box = layout.box()
@@ -116,24 +284,31 @@ def add_dropdown_ui(layout, props, prop_name, text):
     row.prop(props, prop_name, icon=icon, icon_only=True)
     row.label(text=text)
 
-    # Create drop-down box
+    # Create drop-down box (already indented inside the box)
     if is_active:
-        row = box.row()
-        row.column()  # Indent
-        col = row.column()
-        return col
+        return box.column()
     else:
         return None
 
 
+# Transferable property names (src RNA, tgt RNA) -> list of names
+_PROP_CACHE = dict()
+
+
 def pass_props(src_props, tgt_props):
-    for name in dir(src_props):
-        if name.startswith(('_', 'bl_', 'rna_type')):
-            continue  # Skip hidden properties
-        if hasattr(tgt_props, name):
-            # Pass through
-            prop = getattr(src_props, name)
-            setattr(tgt_props, name, prop)
+    key = (src_props.bl_rna.identifier, tgt_props.bl_rna.identifier)
+    names = _PROP_CACHE.get(key)
+    if names is None:
+        # Collect shared properties once
+        tgt_names = tgt_props.bl_rna.properties.keys()
+        names = [name for name in src_props.bl_rna.properties.keys()
+                 if not name.startswith(('_', 'bl_', 'rna_type')) and
+                 name in tgt_names]
+        _PROP_CACHE[key] = names
+
+    # Pass through
+    for name in names:
+        setattr(tgt_props, name, getattr(src_props, name))
 
 
 # -----------------------------------------------------------------------------
@@ -144,10 +319,10 @@ class BNGP_OT_ExecCamGeneration(bpy.types.Operator):
     bl_label = 'Generate cameras'
     bl_options = {'REGISTER', 'UNDO'}
 
-    n_cams_holi: bpy.props.IntProperty(options={'HIDDEN'})
-    n_cams_vert: bpy.props.IntProperty(options={'HIDDEN'})
-    cam_dist: bpy.props.FloatProperty(options={'HIDDEN'})
-    cam_fov: bpy.props.FloatProperty(options={'HIDDEN'})
+    n_cams_holi: bpy.props.IntProperty(options={'HIDDEN', 'SKIP_SAVE'})
+    n_cams_vert: bpy.props.IntProperty(options={'HIDDEN', 'SKIP_SAVE'})
+    cam_dist: bpy.props.FloatProperty(options={'HIDDEN', 'SKIP_SAVE'})
+    cam_fov: bpy.props.FloatProperty(options={'HIDDEN', 'SKIP_SAVE'})
 
     def execute(self, context):
         # Fetch target object
@@ -159,31 +334,46 @@ class BNGP_OT_ExecCamGeneration(bpy.types.Operator):
         cam_coll_name = f'{PREFIX}__cam_coll'
         cam_coll = create_collection(context, cam_coll_name)
 
-        # Create cameras
+        # Compute camera locations on a sphere
+        holi_idxs = np.arange(self.n_cams_holi)
+        vert_idxs = np.arange(self.n_cams_vert)
+        phi = 2.0 * PI * holi_idxs / self.n_cams_holi
+        theta = PI * (vert_idxs + 1) / (self.n_cams_vert + 1)
+        st, ct, cp, sp = np.broadcast_arrays(np.sin(theta)[:, None],
+                                             np.cos(theta)[:, None],
+                                             np.cos(phi)[None, :],
+                                             np.sin(phi)[None, :])
+        # Camera axes (-Z to the center, Y to the world Z) and location
+        cam_axes = np.stack([np.stack([-sp, cp, np.zeros_like(st)], -1),
+                             np.stack([-ct * cp, -ct * sp, st], -1),
+                             np.stack([st * cp, st * sp, ct], -1)], -1)
+        unit_locs = cam_axes[..., 2]
+
+        # Compose camera matrices (N, 4, 4)
         n_cams = self.n_cams_vert * self.n_cams_holi
-        for c_idx in range(n_cams):
-            holi_idx = c_idx % self.n_cams_holi
-            vert_idx = c_idx // self.n_cams_holi
+        cam_mats = np.tile(np.eye(4), (n_cams, 1, 1))
+        cam_mats[:, :3, :3] = cam_axes.reshape(-1, 3, 3)
+        cam_mats[:, :3, 3] = unit_locs.reshape(-1, 3) * self.cam_dist + \
+                             np.asarray(center_pos)
 
+        # Create camera data shared by all cameras (degree -> radian)
+        cam_data = create_cam_data(f'{PREFIX}__cam_data',
+                                   math.radians(self.cam_fov))
+
+        # Create cameras
+        cam_objs = list()
+        for c_idx in range(n_cams):
             # Create camera object
             cam_name = f'{PREFIX}__cam_{c_idx:03}'
-            cam_obj = create_cam_obj(context, cam_name, cam_coll)
-
-            # Set camera location
-            phi = 2.0 * PI * holi_idx / self.n_cams_holi
-            theta = PI * (vert_idx + 1) / (self.n_cams_vert + 1)
-            unit_loc = mathutils.Vector([math.sin(theta) * math.cos(phi),
-                                         math.sin(theta) * math.sin(phi),
-                                         math.cos(theta)])
-            cam_obj.location = unit_loc * self.cam_dist + center_pos
-            # Set camera direction
-            direction = center_pos - cam_obj.location
-            cam_obj. rotation_mode = 'QUATERNION'
-            cam_obj.rotation_quaternion = direction.to_track_quat('-Z', 'Y')
-
-            # Set camera FOV (degree -> radian)
-            cam_obj.data.lens_unit = 'FOV'
-            cam_obj.data.angle = math.radians(self.cam_fov)
+            cam_obj = create_cam_obj(context, cam_name, cam_coll, cam_data)
+            cam_obj.rotation_mode = 'QUATERNION'
+            cam_objs.append(cam_obj)
+
+        # Set camera matrices in bulk
+        set_matrix_worlds(cam_coll.objects, cam_objs, cam_mats)
+
+        # Update view layer once after all cameras are linked
+        context.view_layer.update()
 
         return {'FINISHED'}
 
@@ -194,12 +384,331 @@ class BNGP_OT_ExecCamClear(bpy.types.Operator):
     bl_options = {'REGISTER', 'UNDO'}
 
     def execute(self, context):
-        # Remove cameras & collections
-        remove_by_name_prefix(bpy.data.cameras, PREFIX)
-        remove_by_name_prefix(bpy.data.collections, PREFIX)
+        # Remove camera objects, cameras & collections
+        remove_by_name_prefix(bpy.data.objects, PREFIX, 'objects')
+        remove_by_name_prefix(bpy.data.cameras, PREFIX, 'cameras')
+        remove_by_name_prefix(bpy.data.collections, PREFIX, 'collections')
         return {'FINISHED'}
 
 
+# -----------------------------------------------------------------------------
+# ----------------------------- Render Worker Pool ----------------------------
+# -----------------------------------------------------------------------------
+class RenderWorkerConn:
+    def __init__(self, sock):
+        self.sock = sock
+        self.sock.setblocking(True)
+        self.buf = b''
+        self.is_authed = False
+        self.jobs = collections.deque()  # Sent jobs in order
+
+    def send(self, msg):
+        self.sock.sendall((json.dumps(msg) + '\n').encode('utf-8'))
+
+    def recv(self):
+        # Receive complete lines (call only when readable)
+        data = self.sock.recv(65536)
+        if not data:
+            raise RuntimeError('Render worker disconnected')
+        *lines, self.buf = (self.buf + data).split(b'\n')
+        return [json.loads(line) for line in lines]
+
+
+class RenderWorkerPool:
+    def __init__(self, n_workers, dev_type, gpu_idxs):
+        self.key = (n_workers, dev_type, tuple(gpu_idxs))
+        self.work_dirname = tempfile.mkdtemp(prefix=f'{PREFIX}__work_')
+        self.blend_filename = osp.join(self.work_dirname, 'scene.blend')
+        self.scene_version = 0
+        self.errors = list()
+        self.owner = None  # Operator waiting for the submitted jobs
+        self.last_poll = time.monotonic()
+        self._jobs = collections.deque()
+        self._conns = list()
+        self._procs = list()
+
+        # Listen on loopback for workers
+        self._token = secrets.token_hex(16)
+        self._server = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
+        try:
+            self._server.bind(('127.0.0.1', 0))
+            self._server.listen(n_workers)
+            self._server.setblocking(False)
+            host, port = self._server.getsockname()
+
+            # Launch workers (sharing CPU threads instead of each using all)
+            n_threads = max(1, (os.cpu_count() or 1) // n_workers)
+            for w_idx in range(n_workers):
+                env = os.environ.copy()
+                env['BNGP_WORKER_TOKEN'] = self._token
+                if gpu_idxs:
+                    # Split GPUs (round-robin if fewer than workers)
+                    if n_workers <= len(gpu_idxs):
+                        share = gpu_idxs[w_idx::n_workers]
+                    else:
+                        share = [gpu_idxs[w_idx % len(gpu_idxs)]]
+                    visible_env = GPU_VISIBLE_ENVS[dev_type][1]
+                    env['CUDA_DEVICE_ORDER'] = 'PCI_BUS_ID'
+                    env[visible_env] = ','.join(map(str, share))
+                    env['BNGP_GPU_TYPE'] = dev_type
+                self._procs.append(subprocess.Popen(
+                    [bpy.app.binary_path, '-b', '-t', str(n_threads),
+                     '--python', WORKER_SCRIPT, '--', host, str(port)],
+                    env=env))
+        except BaseException:
+            # Do not leak started workers, the socket or the work directory
+            self.close()
+            raise
+
+    def is_alive(self):
+        return all(proc.poll() is None for proc in self._procs)
+
+    def is_busy(self):
+        return bool(self._jobs) or any(c.jobs for c in self._conns)
+
+    def submit(self, jobs):
+        # Jobs are (camera name, output filepath) for the latest scene copy
+        self.scene_version += 1
+        self.errors = list()
+        self.owner = None  # Operator waiting for the submitted jobs
+        self.last_poll = time.monotonic()
+        self._jobs.extend(jobs)
+
+    def poll(self):
+        # Raises OSError, ValueError or RuntimeError on broken workers
+        self.last_poll = time.monotonic()
+        if not self.is_alive():
+            raise RuntimeError('Render worker exited')
+
+        # Accept workers & receive results
+        socks = [self._server] + [conn.sock for conn in self._conns]
+        readable, _, _ = select.select(socks, [], [], 0)
+        for sock in readable:
+            if sock is self._server:
+                self._conns.append(RenderWorkerConn(self._server.accept()[0]))
+                continue
+            conn = next(c for c in self._conns if c.sock is sock)
+            for msg in conn.recv():
+                if not conn.is_authed:
+                    conn.is_authed = msg.get('token') == self._token
+                    if not conn.is_authed:
+                        self._conns.remove(conn)  # Unknown client
+                        sock.close()
+                        break
+                else:
+                    # Finished in order of sending
+                    conn.jobs.popleft()
+                    if 'error' in msg:
+                        self.errors.append(msg['error'])
+
+        # Dispatch jobs to workers which are not fully queued
+        for conn in self._conns:
+            while conn.is_authed and self._jobs and \
+                    len(conn.jobs) < POOL_JOBS_PER_WORKER:
+                cam_name, filepath = self._jobs.popleft()
+                job = {'scene_version': self.scene_version,
+                       'blend': self.blend_filename,
+                       'cam_name': cam_name, 'filepath': filepath}
+                conn.jobs.append(job)
+                conn.send(job)
+
+        return not self.is_busy()
+
+    def close(self):
+        for conn in self._conns:
+            conn.sock.close()
+        self._server.close()
+        for proc in self._procs:
+            proc.terminate()
+        for proc in self._procs:
+            try:
+                proc.wait(timeout=5.0)
+            except subprocess.TimeoutExpired:
+                proc.kill()
+                proc.wait()
+        shutil.rmtree(self.work_dirname, ignore_errors=True)
+
+
+_WORKER_POOL = None
+
+
+def start_worker_pool(n_workers, dev_type, gpu_idxs):
+    # Reuse running pool if it has the same configuration
+    global _WORKER_POOL
+    key = (n_workers, dev_type, tuple(gpu_idxs))
+    if _WORKER_POOL is not None:
+        if _WORKER_POOL.owner is not None:
+            return _WORKER_POOL  # Still rendering (checked by the caller)
+        if _WORKER_POOL.key == key and _WORKER_POOL.is_alive() and \
+                not _WORKER_POOL.is_busy():
+            return _WORKER_POOL
+        stop_worker_pool()  # Changed, broken or left with stale jobs
+    _WORKER_POOL = RenderWorkerPool(n_workers, dev_type, gpu_idxs)
+    if not bpy.app.timers.is_registered(check_worker_pool_idle):
+        bpy.app.timers.register(check_worker_pool_idle,
+                                first_interval=POOL_IDLE_CHECK_INTERVAL,
+                                persistent=True)
+    return _WORKER_POOL
+
+
+def stop_worker_pool():
+    global _WORKER_POOL
+    if _WORKER_POOL is not None:
+        _WORKER_POOL.close()
+        _WORKER_POOL = None
+
+
+def check_worker_pool_idle():
+    # Stop unused pool to release workers and their scenes
+    # (busy without owner means nobody waits for the jobs anymore)
+    if _WORKER_POOL is None:
+        return None  # Stop timer
+    idle_time = time.monotonic() - _WORKER_POOL.last_poll
+    if _WORKER_POOL.owner is None and \
+            (_WORKER_POOL.is_busy() or idle_time > POOL_IDLE_TIMEOUT):
+        stop_worker_pool()
+        return None
+    return POOL_IDLE_CHECK_INTERVAL
+
+
+@bpy.app.handlers.persistent
+def stop_worker_pool_handler(*args):
+    # Loading a file drops running modal operators (and their jobs)
+    stop_worker_pool()
+
+
+# -----------------------------------------------------------------------------
+# -------------------------------- Render Cache -------------------------------
+# -----------------------------------------------------------------------------
+def fetch_scene_uuid(scene):
+    # Per-scene id stored in the file (tells unrelated projects apart)
+    if 'bngp_uuid' not in scene:
+        scene['bngp_uuid'] = uuid.uuid4().hex
+    return scene['bngp_uuid']
+
+
+def fetch_rna_values(struct):
+    # Plain property values of an RNA struct (pointers, read-only and ID
+    # properties such as `session_uid` or `users` are skipped)
+    id_names = bpy.types.ID.bl_rna.properties.keys()
+    values = list()
+    for prop in struct.bl_rna.properties:
+        if prop.type in {'POINTER', 'COLLECTION'} or prop.is_readonly or \
+                prop.identifier in id_names:
+            continue
+        value = getattr(struct, prop.identifier)
+        if getattr(prop, 'is_array', False):
+            value = np.array(value, dtype=np.float64).ravel().tolist()
+        values.append((prop.identifier, value))
+    return values
+
+
+def compute_scene_key(scene, resolution_pct):
+    # Hash file, render settings and placement of renderable objects
+    # (materials, textures and mesh edits inside the bounds are not tracked)
+    render = scene.render
+    img_settings = render.image_settings
+    h = hashlib.blake2b(digest_size=16)
+    h.update(repr((bpy.data.filepath, scene.name,
+                   fetch_scene_uuid(scene))).encode())
+    h.update(repr((fetch_rna_values(scene.view_settings),
+                   fetch_rna_values(scene.display_settings))).encode())
+    h.update(repr((render.engine, render.resolution_x, render.resolution_y,
+                   resolution_pct, render.film_transparent,
+                   img_settings.file_format, img_settings.color_mode,
+                   img_settings.color_depth, scene.frame_current,
+                   getattr(getattr(scene, 'cycles', None), 'samples', None),
+                   getattr(getattr(scene, 'eevee', None),
+                           'taa_render_samples', None),
+                   scene.world.name if scene.world else None)).encode())
+    h.update(repr([(coll.name, coll.hide_render)
+                   for coll in bpy.data.collections]).encode())
+    for obj in sorted(scene.objects, key=lambda o: o.name):
+        if obj.type == 'CAMERA' or obj.hide_render:
+            continue
+        h.update(repr((obj.name, obj.type,
+                       obj.data.name if obj.data else None,
+                       [slot.name for slot in obj.material_slots])).encode())
+        if obj.type == 'LIGHT':
+            # Energy, color, size, ...
+            h.update(repr(fetch_rna_values(obj.data)).encode())
+        h.update(np.array(obj.matrix_world, dtype=np.float64).tobytes())
+        h.update(np.array(obj.bound_box, dtype=np.float64).tobytes())
+    return h.digest()
+
+
+def compute_cam_key(scene_key, cam_obj, cam_mat):
+    cam = cam_obj.data
+    h = hashlib.blake2b(scene_key, digest_size=16)
+    h.update(np.ascontiguousarray(cam_mat, dtype=np.float64).tobytes())
+    h.update(repr((cam.type, cam.lens_unit, cam.angle, cam.clip_start,
+                   cam.clip_end, cam.sensor_fit, cam.shift_x,
+                   cam.shift_y)).encode())
+    return h.hexdigest()
+
+
+def load_render_key(filepath):
+    # Key of the camera which `filepath` was rendered with ('.sha' sidecar)
+    try:
+        with open(filepath + '.sha') as f:
+            return f.read().strip()
+    except OSError:
+        return None
+
+
+def save_render_key(filepath, key):
+    with open(filepath + '.sha', 'w') as f:
+        f.write(key)
+
+
+def remove_render_key(filepath):
+    try:
+        os.remove(filepath + '.sha')
+    except FileNotFoundError:
+        pass
+
+
+def fetch_cached_render(key, filepath):
+    # Entries may be evicted at any time (other Blender instances)
+    cache_filename = osp.join(CACHE_DIRNAME, key + '.png')
+    try:
+        shutil.copyfile(cache_filename, filepath)
+        os.utime(cache_filename)  # Mark as recently used
+    except FileNotFoundError:
+        return False
+    return True
+
+
+def store_cached_render(key, filepath):
+    # Copy atomically (other Blender instances may share the cache)
+    os.makedirs(CACHE_DIRNAME, exist_ok=True)
+    cache_filename = osp.join(CACHE_DIRNAME, key + '.png')
+    tmp_filename = f'{cache_filename}.{os.getpid()}.tmp'
+    shutil.copyfile(filepath, tmp_filename)
+    os.replace(tmp_filename, cache_filename)
+
+
+def evict_cached_renders(max_bytes=CACHE_MAX_BYTES):
+    # Remove least recently used renders until the cache fits
+    entries = list()
+    for entry in os.scandir(CACHE_DIRNAME):
+        if entry.name.endswith('.png'):
+            try:
+                stat = entry.stat()
+            except FileNotFoundError:
+                continue  # Removed by another Blender instance
+            entries.append((stat.st_mtime, stat.st_size, entry.path))
+    total_bytes = sum(size for _, size, _ in entries)
+    for _, size, path in sorted(entries):
+        if total_bytes <= max_bytes:
+            break
+        try:
+            os.remove(path)
+        except FileNotFoundError:
+            pass
+        total_bytes -= size
+
+
 # -----------------------------------------------------------------------------
 # --------------------------------- Rendering ---------------------------------
 # -----------------------------------------------------------------------------
@@ -208,57 +717,184 @@ class BNGP_OT_ExecRender(bpy.types.Operator):
     bl_label = 'Render'
     bl_options = {'REGISTER', 'UNDO'}
 
-    cam_fov: bpy.props.FloatProperty(options={'HIDDEN'})
-    render_width: bpy.props.IntProperty(options={'HIDDEN'})
-    render_height: bpy.props.IntProperty(options={'HIDDEN'})
+    render_width: bpy.props.IntProperty(options={'HIDDEN', 'SKIP_SAVE'})
+    render_height: bpy.props.IntProperty(options={'HIDDEN', 'SKIP_SAVE'})
+    n_workers: bpy.props.IntProperty(options={'HIDDEN', 'SKIP_SAVE'})
+    preview_mode: bpy.props.BoolProperty(options={'HIDDEN', 'SKIP_SAVE'})
+    preview_pct: bpy.props.IntProperty(options={'HIDDEN', 'SKIP_SAVE'})
+    use_cache: bpy.props.BoolProperty(options={'HIDDEN', 'SKIP_SAVE'})
+    out_dir: bpy.props.StringProperty(options={'HIDDEN', 'SKIP_SAVE'})
+    skip_unchanged: bpy.props.BoolProperty(options={'HIDDEN', 'SKIP_SAVE'})
 
     def execute(self, context):
         # Fetch camera objects
-        cam_objs = collect_by_name_prefix(bpy.data.objects, f'{PREFIX}__cam')
+        cam_objs = collect_by_name_prefix(bpy.data.objects, f'{PREFIX}__cam',
+                                          'objects')
         if len(cam_objs) == 0:
             self.report({'ERROR'}, 'No camera objects found')
-            return {'CANCELED'}
+            return {'CANCELLED'}
+
+        scene = context.scene
+        render = scene.render
+        img_settings = render.image_settings
 
         # Set resolution
-        context.scene.render.resolution_x = self.render_width
-        context.scene.render.resolution_y = self.render_height
+        render.resolution_x = self.render_width
+        render.resolution_y = self.render_height
+        # Scale (only for workers, user setting is kept)
+        resolution_pct = self.preview_pct if self.preview_mode else 100
         # Set file format
-        context.scene.render.image_settings.file_format = 'PNG'
-        context.scene.render.image_settings.color_mode = 'RGBA'
-        context.scene.render.image_settings.color_depth = '8'
-        context.scene.render.film_transparent = True
-
-        # Create output directory
-        out_dirname = tempfile.mkdtemp(prefix=f'{PREFIX}__')
+        img_settings.file_format = 'PNG'
+        img_settings.color_mode = 'RGBA'
+        img_settings.color_depth = '8'
+        render.film_transparent = True
+
+        # Create output directory (persistent one is reused)
+        if self.out_dir:
+            out_dirname = bpy.path.abspath(self.out_dir)
+            os.makedirs(out_dirname, exist_ok=True)
+        else:
+            out_dirname = tempfile.mkdtemp(prefix=f'{PREFIX}__')
         self.report({'INFO'}, f'Output directory: {out_dirname}')
 
         # Create 'transforms.json'
         trans_dict = dict()
-        trans_dict['camera_angle_x'] = math.radians(self.cam_fov)
+        trans_dict['camera_angle_x'] = cam_objs[0].data.angle
         trans_dict['frames'] = list()
 
-        # Render
-        for cam_obj in cam_objs:
-            # Set active camera
-            set_active_camera(context, cam_obj)
-            # Set output filename
-            img_basename = cam_obj.name + '.png'
-            context.scene.render.filepath = osp.join(out_dirname, img_basename)
+        # Collect camera matrices at once (N, 4, 4)
+        cam_mats = np.array([cam_obj.matrix_world for cam_obj in cam_objs],
+                            dtype=np.float64)
 
-            # Collect frame information
+        # Collect frame information
+        for cam_obj, cam_mat in zip(cam_objs, cam_mats):
+            img_basename = cam_obj.name + '.png'
             frame_dict = dict()
             frame_dict['file_path'] = osp.join('./', img_basename)
-            frame_dict['transform_matrix'] = \
-                    [list(row) for row in cam_obj.matrix_world.row]
+            frame_dict['transform_matrix'] = cam_mat
             trans_dict['frames'].append(frame_dict)
 
-            # Render
-            bpy.ops.render.render(write_still=True)
-
+        # Collect cameras to render (up-to-date or cached images are reused)
+        jobs = list()
+        cam_keys = dict()
+        use_keys = self.use_cache or bool(self.out_dir)
+        if use_keys:
+            scene_key = compute_scene_key(scene, resolution_pct)
+        for cam_obj, cam_mat in zip(cam_objs, cam_mats):
+            filepath = osp.join(out_dirname, cam_obj.name + '.png')
+            if use_keys:
+                key = compute_cam_key(scene_key, cam_obj, cam_mat)
+                if self.skip_unchanged and osp.exists(filepath) and \
+                        load_render_key(filepath) == key:
+                    continue  # Rendered by a previous run
+                if self.use_cache and fetch_cached_render(key, filepath):
+                    if self.out_dir:
+                        save_render_key(filepath, key)
+                    continue
+                remove_render_key(filepath)
+                cam_keys[filepath] = key
+            jobs.append((cam_obj.name, filepath))
+
+        # Keep state for modal
+        self._out_dirname = out_dirname
+        self._trans_dict = trans_dict
+        self._cam_keys = cam_keys
+        if not jobs:
+            return self.finish()  # Nothing to render
+
+        # Start (or reuse) render workers
+        dev_type, gpu_idxs = fetch_gpu_indices(context)
+        try:
+            n_workers = max(1, min(self.n_workers, len(cam_objs)))
+            pool = start_worker_pool(n_workers, dev_type, gpu_idxs)
+        except OSError as e:
+            stop_worker_pool()
+            self.report({'ERROR'}, f'Failed to start render workers: {e}')
+            return {'CANCELLED'}
+        if pool.owner is not None:
+            self.report({'ERROR'}, 'Rendering is already running')
+            return {'CANCELLED'}
+
+        # Save a copy of the scene for render workers, with overridden settings
+        # (user settings are restored after saving)
+        cycles = getattr(scene, 'cycles', None)
+        eevee = getattr(scene, 'eevee', None)
+        with temp_attrs(render,
+                        resolution_percentage=resolution_pct,
+                        # Keep render data between frames (memory for time)
+                        use_persistent_data=True,
+                        # No post processes, NGP averages many views anyway
+                        use_motion_blur=False), \
+             temp_attrs(render.ffmpeg, audio_codec='NONE'), \
+             temp_attrs(img_settings,
+                        # Fast PNG encoding (zlib level 1)
+                        compression=PNG_COMPRESSION), \
+             temp_attrs(cycles,
+                        use_denoising=False,
+                        # Faster BVH build, which is done once per scene
+                        debug_use_spatial_splits=False), \
+             temp_attrs(eevee, use_motion_blur=False):
+            bpy.ops.wm.save_as_mainfile(filepath=pool.blend_filename,
+                                        copy=True)
+
+        # Submit cameras (workers pick them up as they become idle)
+        pool.submit(jobs)
+        pool.owner = self
+        self._pool = pool
+
+        # Wait for workers without blocking UI
+        wm = context.window_manager
+        self._timer = wm.event_timer_add(POOL_POLL_INTERVAL,
+                                         window=context.window)
+        wm.modal_handler_add(self)
+        return {'RUNNING_MODAL'}
+
+    def modal(self, context, event):
+        if event.type == 'ESC':
+            return self.cancel_render(context, 'Rendering cancelled')
+        if event.type != 'TIMER':
+            return {'PASS_THROUGH'}
+        try:
+            if not self._pool.poll():
+                return {'PASS_THROUGH'}  # Still rendering
+        except (OSError, ValueError, RuntimeError) as e:
+            return self.cancel_render(context, f'Render worker failed: {e}')
+
+        # Check results
+        context.window_manager.event_timer_remove(self._timer)
+        self._pool.owner = None  # Keep workers for the next render
+        if self._pool.errors:
+            for error in self._pool.errors:
+                self.report({'ERROR'}, f'Render failed: {error}')
+            return {'CANCELLED'}
+
+        # Store keys of rendered images (+ images to the cache)
+        for filepath, key in self._cam_keys.items():
+            if self.out_dir:
+                save_render_key(filepath, key)
+            if self.use_cache:
+                store_cached_render(key, filepath)
+        if self.use_cache and self._cam_keys:
+            evict_cached_renders()
+
+        return self.finish()
+
+    def cancel(self, context):
+        # Called by Blender when it drops the modal operator as well
+        # (workers may be in the middle of jobs, so the pool is discarded)
+        context.window_manager.event_timer_remove(self._timer)
+        if _WORKER_POOL is self._pool:
+            stop_worker_pool()
+
+    def cancel_render(self, context, msg):
+        self.cancel(context)
+        self.report({'ERROR'}, msg)
+        return {'CANCELLED'}
+
+    def finish(self):
         # Save 'transforms.json'
-        json_filename = osp.join(out_dirname, 'transforms.json')
-        with open(json_filename, 'w') as f:
-            json.dump(trans_dict, f, indent=4, ensure_ascii=True)
+        json_filename = osp.join(self._out_dirname, 'transforms.json')
+        save_json(json_filename, self._trans_dict)
 
         return {'FINISHED'}
 
@@ -290,12 +926,12 @@ class BNGP_PT_MainPanel(bpy.types.Panel):
             row = box.row()
             row.label(text=f'Target: "{tgt_obj_name}"')
             row = box.row()
-            row.prop(props, 'n_cams_holi', text='Horizontal number')
-            row.prop(props, 'n_cams_vert', text='Vertical number')
+            row.prop(props.cam, 'n_cams_holi', text='Horizontal number')
+            row.prop(props.cam, 'n_cams_vert', text='Vertical number')
             row = box.row()
-            row.prop(props, 'cam_dist', text='Camera distance')
+            row.prop(props.cam, 'cam_dist', text='Camera distance')
             row = box.row()
-            row.prop(props, 'cam_fov', text='FOV')
+            row.prop(props.cam, 'cam_fov', text='FOV')
             row = box.row()
             box.separator()
             # Generation button
@@ -303,7 +939,7 @@ class BNGP_PT_MainPanel(bpy.types.Panel):
             row.enabled = bool(tgt_obj)
             child_props = row.operator(BNGP_OT_ExecCamGeneration.bl_idname,
                                        icon='VIEW_CAMERA')
-            pass_props(props, child_props)
+            pass_props(props.cam, child_props)
             # Clear button
             row = box.row()
             row.operator(BNGP_OT_ExecCamClear.bl_idname, icon='TRASH')
@@ -313,30 +949,61 @@ class BNGP_PT_MainPanel(bpy.types.Panel):
         if box:
             # Properties
             row = box.row()
-            row.prop(props, 'render_width', text='Width')
-            row.prop(props, 'render_height', text='Height')
+            row.prop(props.render, 'render_width', text='Width')
+            row.prop(props.render, 'render_height', text='Height')
+            row = box.row()
+            row.prop(props.render, 'n_workers', text='Workers')
+            row = box.row()
+            row.prop(props.render, 'preview_mode', text='Preview')
+            sub = row.row()
+            sub.enabled = props.render.preview_mode
+            sub.prop(props.render, 'preview_pct', text='Scale')
+            row = box.row()
+            row.prop(props.render, 'use_cache', text='Reuse cached renders')
+            row = box.row()
+            row.prop(props.render, 'out_dir', text='Output')
+            row = box.row()
+            row.enabled = bool(props.render.out_dir)
+            row.prop(props.render, 'skip_unchanged',
+                     text='Skip unchanged renders')
             # Render button
             row = box.row()
             child_props = row.operator(BNGP_OT_ExecRender.bl_idname,
                                        icon='OUTPUT')
-            pass_props(props, child_props)
+            pass_props(props.render, child_props)
 
 
 
 # -----------------------------------------------------------------------------
 # -------------------------------- Properties ---------------------------------
 # -----------------------------------------------------------------------------
-class BNGP_Props(bpy.types.PropertyGroup):
-    # Camera
-    ui_cam: bpy.props.BoolProperty(default=True)
+class BNGP_CamProps(bpy.types.PropertyGroup):
     n_cams_holi: bpy.props.IntProperty(default=8, min=1)
     n_cams_vert: bpy.props.IntProperty(default=3, min=1)
     cam_dist: bpy.props.FloatProperty(default=5.0, min=EPS)
     cam_fov: bpy.props.FloatProperty(default=40.0, min=EPS, max=180.0)
-    # Render
-    ui_render: bpy.props.BoolProperty(default=True)
+
+
+class BNGP_RenderProps(bpy.types.PropertyGroup):
     render_width: bpy.props.IntProperty(default=512, min=1)
     render_height: bpy.props.IntProperty(default=512, min=1)
+    n_workers: bpy.props.IntProperty(default=min(2, os.cpu_count() or 1),
+                                     min=1)
+    preview_mode: bpy.props.BoolProperty(default=False)
+    preview_pct: bpy.props.IntProperty(default=25, min=1, max=100,
+                                       subtype='PERCENTAGE')
+    use_cache: bpy.props.BoolProperty(default=False)
+    out_dir: bpy.props.StringProperty(subtype='DIR_PATH')
+    skip_unchanged: bpy.props.BoolProperty(default=False)
+
+
+class BNGP_Props(bpy.types.PropertyGroup):
+    # Camera
+    ui_cam: bpy.props.BoolProperty(default=True)
+    cam: bpy.props.PointerProperty(type=BNGP_CamProps)
+    # Render
+    ui_render: bpy.props.BoolProperty(default=True)
+    render: bpy.props.PointerProperty(type=BNGP_RenderProps)
 
 
 # -----------------------------------------------------------------------------
@@ -347,9 +1014,17 @@ CLASSES = [
     BNGP_OT_ExecCamClear,
     BNGP_OT_ExecRender,
     BNGP_PT_MainPanel,
+    BNGP_CamProps,
+    BNGP_RenderProps,
     BNGP_Props,
 ]
 
+BNGP_NAME_HANDLERS = [
+    bpy.app.handlers.load_post,
+    bpy.app.handlers.undo_post,
+    bpy.app.handlers.redo_post,
+]
+
 
 def register():
     # Register classes
@@ -360,13 +1035,30 @@ def register():
     bpy.types.Scene.bngp_props = \
         bpy.props.PointerProperty(type=BNGP_Props)
 
+    # Register handlers (re-scan created names when data is reloaded)
+    for handlers in BNGP_NAME_HANDLERS:
+        handlers.append(reset_bngp_names)
+    bpy.app.handlers.load_pre.append(stop_worker_pool_handler)
+
 
 def unregister():
+    # Stop render workers
+    stop_worker_pool()
+    if bpy.app.timers.is_registered(check_worker_pool_idle):
+        bpy.app.timers.unregister(check_worker_pool_idle)
+
+    # Un-register handlers
+    for handlers in BNGP_NAME_HANDLERS:
+        if reset_bngp_names in handlers:
+            handlers.remove(reset_bngp_names)
+    if stop_worker_pool_handler in bpy.app.handlers.load_pre:
+        bpy.app.handlers.load_pre.remove(stop_worker_pool_handler)
+
     # Un-register properties
     del bpy.types.Scene.bngp_props
 
     # Un-register classes
-    for c in CLASSES:
+    for c in reversed(CLASSES):
         bpy.utils.unregister_class(c)
 
 
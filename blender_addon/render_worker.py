@@ -0,0 +1,63 @@
+import json
+import os
+import socket
+import sys
+
+# Blender modules
+import bpy
+
+
+# -----------------------------------------------------------------------------
+# ------------------------------- Render Worker -------------------------------
+# -----------------------------------------------------------------------------
+# Launched by the addon as `blender -b --python render_worker.py -- HOST PORT`.
+# Stays alive with the scene loaded and renders the cameras it receives
+# (one JSON line per job) until the connection is closed.
+def send_msg(f, msg):
+    f.write(json.dumps(msg) + '\n')
+    f.flush()
+
+
+def setup_gpu(dev_type):
+    # Enable visible GPUs only (limited by `*_VISIBLE_DEVICES`)
+    cprefs = bpy.context.preferences.addons['cycles'].preferences
+    cprefs.compute_device_type = dev_type
+    for device in cprefs.get_devices_for_type(dev_type):
+        device.use = device.type != 'CPU'
+
+
+def main():
+    host, port = sys.argv[sys.argv.index('--') + 1:]
+
+    # Set up assigned GPU
+    dev_type = os.environ.get('BNGP_GPU_TYPE')
+    if dev_type:
+        setup_gpu(dev_type)
+
+    with socket.create_connection((host, int(port))) as sock:
+        # Separate files (writing to a 'rw' file drops buffered lines)
+        f_in = sock.makefile('r', encoding='utf-8')
+        f_out = sock.makefile('w', encoding='utf-8')
+        send_msg(f_out, {'token': os.environ['BNGP_WORKER_TOKEN']})
+
+        scene_version = None
+        for line in f_in:
+            job = json.loads(line)
+            try:
+                # Load the scene only when it was updated
+                if job['scene_version'] != scene_version:
+                    bpy.ops.wm.open_mainfile(filepath=job['blend'])
+                    scene_version = job['scene_version']
+
+                # Render
+                scene = bpy.context.scene
+                scene.camera = bpy.data.objects[job['cam_name']]
+                scene.render.filepath = job['filepath']
+                bpy.ops.render.render(write_still=True)
+                send_msg(f_out, {'done': job['cam_name']})
+            except Exception as e:
+                send_msg(f_out, {'error': f'{job["cam_name"]}: {e}'})
+
+
+if __name__ == '__main__':
+    main()